@@ -1,10 +1,13 @@
 from fastapi import FastAPI, Request, Form
 from fastapi.middleware.cors import CORSMiddleware 
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 
+import brotli
 import datetime
+import gzip
+import hashlib
 import os
 import logging
 import oracledb
@@ -51,9 +54,106 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 ) 
-app.mount("/static", StaticFiles(directory="static"), name="static")
+
+# -----------------------------
+# Response caching
+# -----------------------------
+
+# Fingerprint of the stylesheet. Templates link to `static/style.css?v=<version>`,
+# so the URL changes whenever the file does and browsers can cache it forever.
+with open("static/style.css", "rb") as f:
+    STATIC_VERSION = hashlib.sha256(f.read()).hexdigest()[:12]
+
+# How long browsers and Nginx may reuse a page shell before revalidating it.
+PAGE_MAX_AGE = 300
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that marks fingerprinted requests as immutable."""
+
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            # STATIC_VERSION only fingerprints style.css, so no other asset is immutable.
+            query = scope.get("query_string", b"").split(b"&")
+            if path == "style.css" and f"v={STATIC_VERSION}".encode() in query:
+                response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+            else:
+                response.headers["Cache-Control"] = "no-cache"
+        return response
+
+
+app.mount("/static", CachedStaticFiles(directory="static"), name="static")
 
 templates = Jinja2Templates(directory="templates")
+templates.env.globals["static_version"] = STATIC_VERSION
+
+
+def prerender_page(template_name):
+    """Render a template without dynamic content once and keep every encoding of it in memory."""
+    body = templates.get_template(template_name).render().encode("utf-8")
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    # Each encoding is a different representation, so each gets its own strong ETag.
+    # mtime=0 keeps the gzip bytes identical across restarts, as a strong ETag requires.
+    return {
+        "identity": (body, f'"{digest}"'),
+        "gzip": (gzip.compress(body, compresslevel=9, mtime=0), f'"{digest}-gz"'),
+        "br": (brotli.compress(body, quality=11), f'"{digest}-br"'),
+    }
+
+
+def choose_encoding(accept_encoding):
+    """Pick the accepted encoding with the highest q-value, preferring brotli over gzip on ties."""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        qvalue = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    qvalue = float(value.strip())
+                except ValueError:
+                    qvalue = 0.0
+        accepted[coding.strip().lower()] = qvalue
+
+    best, best_q = "identity", 0.0
+    for coding in ("br", "gzip"):
+        qvalue = accepted.get(coding, accepted.get("*", 0.0))
+        if qvalue > best_q:
+            best, best_q = coding, qvalue
+    return best
+
+
+def cached_page_response(request, page):
+    """Serve a prerendered page, answering 304 when the client already has it."""
+    encoding = choose_encoding(request.headers.get("accept-encoding", ""))
+    body, etag = page[encoding]
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={PAGE_MAX_AGE}",
+        "Vary": "Accept-Encoding",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # If-None-Match uses weak comparison, so ignore a `W/` prefix added by proxies.
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        if "*" in tags or etag in tags:
+            return Response(status_code=304, headers=headers)
+
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="text/html", headers=headers)
+
+
+# Page shells have no dynamic content, so they are rendered once at startup.
+cached_pages = {
+    "index": prerender_page("index.html"),
+    "bill_payment": prerender_page("bill_payment.html"),
+    "bill_retrieval": prerender_page("bill_retrieval.html"),
+    "bill_adjustment": prerender_page("bill_adjustment.html"),
+}
 
 
 # -----------------------------
@@ -63,22 +163,22 @@ templates = Jinja2Templates(directory="templates")
 # ---------- GET methods for the pages ----------
 @app.get("/", response_class=HTMLResponse)
 async def get_index(request: Request):
-    return templates.TemplateResponse("index.html", {"request": request})
+    return cached_page_response(request, cached_pages["index"])
 
 # Bill payment page
 @app.get("/bill-payment", response_class=HTMLResponse)
 async def get_bill_payment(request: Request):
-    return templates.TemplateResponse("bill_payment.html", {"request": request})
+    return cached_page_response(request, cached_pages["bill_payment"])
 
 # Bill generation page
 @app.get("/bill-retrieval", response_class=HTMLResponse)
 async def get_bill_retrieval(request: Request):
-    return templates.TemplateResponse("bill_retrieval.html", {"request": request})
+    return cached_page_response(request, cached_pages["bill_retrieval"])
 
 # Adjustments page
 @app.get("/bill-adjustments", response_class=HTMLResponse)
 async def get_bill_adjustment(request: Request):
-    return templates.TemplateResponse("bill_adjustment.html", {"request": request})
+    return cached_page_response(request, cached_pages["bill_adjustment"])
 
 
 # ---------- POST methods for the pages ----------
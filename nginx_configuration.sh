@@ -69,11 +69,43 @@ else
   warn "Nginx is installed but not running. You may need to troubleshoot."
 fi
 
+# cache directory for the page shells and static assets proxied from the application
+sudo mkdir -p /var/cache/nginx/app_server || error "Failed to create the Nginx cache directory."
+
 # create a configuration file for the application server
 log "Creating a configuration file for the application server..."
-echo "server{
+echo "proxy_cache_path /var/cache/nginx/app_server levels=1:2 keys_zone=app_pages:10m max_size=50m inactive=60m;
+
+server{
     server_name ${SERVER_IP};
 
+    gzip on;
+    gzip_vary on;
+    gzip_proxied any;
+    gzip_comp_level 6;
+    gzip_types text/css application/javascript application/json image/svg+xml;
+
+    # static assets: the app sends ETag and Cache-Control (immutable only for the current ?v= fingerprint)
+    location /static/ {
+           include proxy_params;
+           proxy_pass http://127.0.0.1:8000;
+           proxy_cache app_pages;
+           proxy_cache_revalidate on;
+           proxy_cache_use_stale error timeout updating;
+           add_header X-Cache-Status \$upstream_cache_status;
+       }
+
+    # read-only page shells: cached by Nginx, POST requests always reach the app
+    location ~ ^/(bill-payment|bill-retrieval|bill-adjustments)?\$ {
+           include proxy_params;
+           proxy_pass http://127.0.0.1:8000;
+           proxy_cache app_pages;
+           proxy_cache_revalidate on;
+           proxy_cache_use_stale error timeout updating;
+           proxy_cache_lock on;
+           add_header X-Cache-Status \$upstream_cache_status;
+       }
+
     location / {
            include proxy_params;
            proxy_pass http://127.0.0.1:8000;